@@ -1,6 +1,9 @@
 package com.distributed.matrix;
 
 import java.io. Serializable;
+import java.util.Collections;
+import java.util.LinkedHashMap;
+import java.util.Map;
 
 public class BenchmarkResult implements Serializable {
     private static final long serialVersionUID = 1L;
@@ -10,14 +13,21 @@ public class BenchmarkResult implements Serializable {
     private double memoryUsedMB;
     private int numWorkers;
     private double[][] result;
+    private Map<String, Double> phases;
 
     public BenchmarkResult(String name, double executionTime, double memoryUsedMB,
                            int numWorkers, double[][] result) {
+        this(name, executionTime, memoryUsedMB, numWorkers, result, Collections.emptyMap());
+    }
+
+    public BenchmarkResult(String name, double executionTime, double memoryUsedMB,
+                           int numWorkers, double[][] result, Map<String, Double> phases) {
         this.name = name;
         this.executionTime = executionTime;
         this.memoryUsedMB = memoryUsedMB;
         this.numWorkers = numWorkers;
         this.result = result;
+        this.phases = new LinkedHashMap<>(phases);
     }
 
     public String getName() { return name; }
@@ -25,6 +35,7 @@ public class BenchmarkResult implements Serializable {
     public double getMemoryUsedMB() { return memoryUsedMB; }
     public int getNumWorkers() { return numWorkers; }
     public double[][] getResult() { return result; }
+    public Map<String, Double> getPhases() { return phases; }
 
     public double getSpeedup(double baselineTime) {
         return baselineTime / executionTime;
@@ -6,6 +6,7 @@ import com. google.gson.GsonBuilder;
 import java.io.FileWriter;
 import java.io.IOException;
 import java.util.ArrayList;
+import java.util.Arrays;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
@@ -19,17 +20,39 @@ public class BenchmarkRunner {
 
         int[] sizes = {128, 256, 512, 1024};
         int[] workerCounts = {1, 2, 4, 8};
+        long seed = 42;
+        String output = "results/metrics.json";
+
+        for (int i = 0; i + 1 < args.length; i += 2) {
+            switch (args[i]) {
+                case "--sizes":
+                    sizes = parseIntList(args[i + 1]);
+                    break;
+                case "--workers":
+                    workerCounts = parseIntList(args[i + 1]);
+                    break;
+                case "--seed":
+                    seed = Long.parseLong(args[i + 1]);
+                    break;
+                case "--output":
+                    output = args[i + 1];
+                    break;
+                default:
+                    throw new IllegalArgumentException("Unknown option: " + args[i]);
+            }
+        }
 
         int availableCores = Runtime.getRuntime().availableProcessors();
         System.out.println("\nAvailable CPU cores: " + availableCores);
         System.out.println("Matrix sizes to test: " + arrayToString(sizes));
         System.out.println("Worker counts to test: " + arrayToString(workerCounts));
+        System.out.println("Seed: " + seed);
 
         List<Map<String, Object>> allResults = new ArrayList<>();
 
         for (int size : sizes) {
             try {
-                Map<String, Object> sizeResults = benchmarkMatrixSize(size, workerCounts);
+                Map<String, Object> sizeResults = benchmarkMatrixSize(size, workerCounts, seed);
                 allResults.add(sizeResults);
             } catch (Exception e) {
                 System.err.println("\nError with size " + size + ": " + e.getMessage());
@@ -38,22 +61,22 @@ public class BenchmarkRunner {
         }
 
         if (! allResults.isEmpty()) {
-            saveResults(allResults);
+            saveResults(allResults, output);
             printSummary(allResults);
         }
 
         System.out.println("\nBENCHMARK COMPLETED");
-        System.out.println("\nResults saved to: results/metrics.json");
+        System.out.println("\nResults saved to: " + output);
     }
 
-    private static Map<String, Object> benchmarkMatrixSize(int size, int[] workerCounts) throws Exception {
+    private static Map<String, Object> benchmarkMatrixSize(int size, int[] workerCounts, long seed) throws Exception {
         System.out.println("\n================================================================================");
         System.out. println("BENCHMARK - " + size + "x" + size + " Matrices");
         System.out. println("================================================================================");
 
         System.out.println("\nCreating matrices...");
-        double[][] A = MatrixUtils.createMatrix(size, 1.5);
-        double[][] B = MatrixUtils.createMatrix(size, 2.5);
+        double[][] A = MatrixUtils.createSeededMatrix(size, seed, 0.0, 10.0);
+        double[][] B = MatrixUtils.createSeededMatrix(size, seed + 1, 0.0, 10.0);
 
         List<Map<String, Object>> tests = new ArrayList<>();
 
@@ -72,7 +95,11 @@ public class BenchmarkRunner {
         for (int workers : workerCounts) {
             System.out.println("\n  Executing Hazelcast (" + workers + " workers)...");
 
+            // Member startup is reported apart from total_time, as the Python
+            // engine does for its process pool
+            long startStartup = System.nanoTime();
             DistributedMatrixMultiplier multiplier = new DistributedMatrixMultiplier(workers);
+            double startupTime = (System.nanoTime() - startStartup) / 1_000_000_000.0;
             try {
                 BenchmarkResult hazelcastResult = multiplier.benchmark(A, B);
                 System.out.println("    " + hazelcastResult);
@@ -80,6 +107,7 @@ public class BenchmarkRunner {
                 Map<String, Object> resultMap = resultToMap(hazelcastResult, baselineTime);
                 resultMap.put("speedup", baselineTime / hazelcastResult. getExecutionTime());
                 resultMap.put("efficiency", (baselineTime / hazelcastResult. getExecutionTime()) / workers);
+                resultMap.put("startup_time", startupTime);
 
                 tests.add(resultMap);
             } finally {
@@ -89,6 +117,10 @@ public class BenchmarkRunner {
 
         Map<String, Object> sizeResults = new HashMap<>();
         sizeResults.put("size", (double) size);
+        sizeResults.put("seed", seed);
+        sizeResults.put("operand_sample",
+                Arrays.asList(A[0][0], A[size - 1][size - 1], B[0][0], B[size - 1][size - 1]));
+        sizeResults.put("engine", "java");
         sizeResults. put("tests", tests);
 
         return sizeResults;
@@ -101,6 +133,10 @@ public class BenchmarkRunner {
         map.put("memory_mb", result.getMemoryUsedMB());
         map.put("num_workers", result.getNumWorkers());
 
+        if (!result.getPhases().isEmpty()) {
+            map.put("phases", result.getPhases());
+        }
+
         if (baselineTime > 0) {
             map.put("speedup", result.getSpeedup(baselineTime));
         }
@@ -108,16 +144,19 @@ public class BenchmarkRunner {
         return map;
     }
 
-    private static void saveResults(List<Map<String, Object>> results) {
+    private static void saveResults(List<Map<String, Object>> results, String output) {
         try {
-            new java.io.File("results").mkdirs();
+            java.io.File parent = new java.io.File(output).getAbsoluteFile().getParentFile();
+            if (parent != null) {
+                parent.mkdirs();
+            }
 
             Gson gson = new GsonBuilder().setPrettyPrinting().create();
-            FileWriter writer = new FileWriter("results/metrics.json");
+            FileWriter writer = new FileWriter(output);
             gson.toJson(results, writer);
             writer.close();
 
-            System.out.println("\nResults saved to: results/metrics.json");
+            System.out.println("\nResults saved to: " + output);
         } catch (IOException e) {
             System. err.println("Error saving results: " + e.getMessage());
         }
@@ -161,6 +200,15 @@ public class BenchmarkRunner {
         }
     }
 
+    private static int[] parseIntList(String value) {
+        String[] parts = value.split(",");
+        int[] result = new int[parts.length];
+        for (int i = 0; i < parts.length; i++) {
+            result[i] = Integer.parseInt(parts[i].trim());
+        }
+        return result;
+    }
+
     private static String arrayToString(int[] array) {
         StringBuilder sb = new StringBuilder("[");
         for (int i = 0; i < array.length; i++) {
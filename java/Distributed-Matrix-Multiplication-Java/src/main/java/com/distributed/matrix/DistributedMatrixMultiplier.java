@@ -8,7 +8,9 @@ import com.hazelcast.core.IExecutorService;
 
 import java.io. Serializable;
 import java.util.ArrayList;
+import java.util.LinkedHashMap;
 import java.util.List;
+import java.util.Map;
 import java.util.concurrent.Callable;
 import java.util.concurrent.Future;
 
@@ -16,6 +18,7 @@ public class DistributedMatrixMultiplier {
 
     private HazelcastInstance hazelcastInstance;
     private int numWorkers;
+    private Map<String, Double> lastPhases = new LinkedHashMap<>();
 
     public DistributedMatrixMultiplier(int numWorkers) {
         this.numWorkers = numWorkers;
@@ -34,10 +37,14 @@ public class DistributedMatrixMultiplier {
         int n = A.length;
         int m = B[0].length;
 
+        long startDistribute = System.nanoTime();
+
         IMap<String, double[][]> distributedData = hazelcastInstance.getMap("matrices");
         distributedData.put("A", A);
         distributedData.put("B", B);
 
+        long startSubmit = System.nanoTime();
+
         int blockSize = Math.max(1, n / numWorkers);
 
         IExecutorService executor = hazelcastInstance.getExecutorService("matrix-executor");
@@ -56,9 +63,13 @@ public class DistributedMatrixMultiplier {
         }
 
         double[][] C = new double[n][m];
+        long fetchNanos = 0;
+        long computeNanos = 0;
 
         for (Future<BlockResult> future : futures) {
             BlockResult blockResult = future.get();
+            fetchNanos = Math.max(fetchNanos, blockResult.fetchNanos);
+            computeNanos = Math.max(computeNanos, blockResult.computeNanos);
 
             for (int i = blockResult.startRow; i < blockResult.endRow; i++) {
                 System.arraycopy(
@@ -71,9 +82,26 @@ public class DistributedMatrixMultiplier {
             }
         }
 
+        long endCollect = System.nanoTime();
+
+        // Tasks run in parallel, so the slowest one bounds each in-task phase. Whatever is
+        // left of the executor round trip (scheduling, returning and copying the blocks)
+        // is collect time.
+        long distributeNanos = (startSubmit - startDistribute) + fetchNanos;
+        long collectNanos = Math.max(0, (endCollect - startSubmit) - fetchNanos - computeNanos);
+
+        lastPhases = new LinkedHashMap<>();
+        lastPhases.put("distribute_time", distributeNanos / 1_000_000_000.0);
+        lastPhases.put("compute_time", computeNanos / 1_000_000_000.0);
+        lastPhases.put("collect_time", collectNanos / 1_000_000_000.0);
+
         return C;
     }
 
+    public Map<String, Double> getLastPhases() {
+        return lastPhases;
+    }
+
     public BenchmarkResult benchmark(double[][] A, double[][] B) throws Exception {
         MatrixUtils.gc();
         double memBefore = MatrixUtils.getMemoryUsageMB();
@@ -91,7 +119,8 @@ public class DistributedMatrixMultiplier {
                 executionTime,
                 memoryUsed,
                 numWorkers,
-                result
+                result,
+                lastPhases
         );
     }
 
@@ -118,12 +147,16 @@ public class DistributedMatrixMultiplier {
 
         @Override
         public BlockResult call() throws Exception {
+            long startFetch = System.nanoTime();
+
             HazelcastInstance hz = Hazelcast.getAllHazelcastInstances().iterator().next();
             IMap<String, double[][]> distributedData = hz.getMap("matrices");
 
             double[][] A = distributedData.get("A");
             double[][] B = distributedData.get("B");
 
+            long startCompute = System.nanoTime();
+
             int blockRows = endRow - startRow;
             double[][] blockResult = new double[blockRows][m];
 
@@ -138,7 +171,10 @@ public class DistributedMatrixMultiplier {
                 }
             }
 
-            return new BlockResult(startRow, endRow, blockResult);
+            long endCompute = System.nanoTime();
+
+            return new BlockResult(startRow, endRow, blockResult,
+                    startCompute - startFetch, endCompute - startCompute);
         }
     }
 
@@ -148,11 +184,16 @@ public class DistributedMatrixMultiplier {
         int startRow;
         int endRow;
         double[][] data;
+        long fetchNanos;
+        long computeNanos;
 
-        public BlockResult(int startRow, int endRow, double[][] data) {
+        public BlockResult(int startRow, int endRow, double[][] data,
+                           long fetchNanos, long computeNanos) {
             this. startRow = startRow;
             this.endRow = endRow;
             this.data = data;
+            this.fetchNanos = fetchNanos;
+            this.computeNanos = computeNanos;
         }
     }
 }
\ No newline at end of file
@@ -25,6 +25,20 @@ public class MatrixUtils {
         return matrix;
     }
 
+    // Same 64-bit LCG as create_seeded_matrix in the Python engine, so both
+    // engines multiply bit-identical operands for a given seed.
+    public static double[][] createSeededMatrix(int n, long seed, double min, double max) {
+        long state = seed;
+        double[][] matrix = new double[n][n];
+        for (int i = 0; i < n; i++) {
+            for (int j = 0; j < n; j++) {
+                state = state * 6364136223846793005L + 1442695040888963407L;
+                matrix[i][j] = min + (max - min) * ((state >>> 11) * 0x1.0p-53);
+            }
+        }
+        return matrix;
+    }
+
     public static boolean verifyResult(double[][] result, double expectedValue, int size) {
         double tolerance = 0.01;
         return Math.abs(result[0][0] - expectedValue) < tolerance;
@@ -9,6 +9,7 @@ from distributed_matrix_multiplication import (
     OptimizedMatrixMultiplier,
     create_matrix,
     create_random_matrix,
+    create_seeded_matrix,
     measure_memory
 )
 
@@ -16,16 +17,23 @@ def benchmark_single_test(multiplier_class, A, B, num_workers=None, name="Test")
     print(f"\n  Executing {name}...")
     
     mem_before = measure_memory()
-    start_time = time.time()
+    startup_time = None
     
+    # Pool startup is reported apart from total_time, as the Java engine
+    # does for its Hazelcast member
     if num_workers is not None:
+        start_startup = time.time()
         with multiplier_class(num_workers=num_workers) as mult:
+            startup_time = time.time() - start_startup
+            start_time = time.time()
             C, metrics = mult.multiply(A, B)
+            total_time = time.time() - start_time
     else:
         mult = multiplier_class()
+        start_time = time.time()
         C, metrics = mult.multiply(A, B)
+        total_time = time.time() - start_time
     
-    total_time = time.time() - start_time
     mem_after = measure_memory()
     mem_used = mem_after - mem_before
     
@@ -38,23 +46,27 @@ def benchmark_single_test(multiplier_class, A, B, num_workers=None, name="Test")
     
     if num_workers:  
         result['num_workers'] = num_workers
+        result['startup_time'] = startup_time
     
     print(f"    ✓ Time: {total_time:.4f}s | Memory: {mem_used:.2f}MB")
     
     return result
 
 
-def benchmark_matrix_size(size, workers_list=[1, 2, 4, 8]):
+def benchmark_matrix_size(size, workers_list=[1, 2, 4, 8], seed=42):
     print(f"\n{'=' * 80}")
     print(f"BENCHMARK - {size}×{size} Matrices")
     print(f"{'=' * 80}")
     
     print(f"\nCreating matrices...")
-    A = create_matrix(size, value=1.5)
-    B = create_matrix(size, value=2.5)
+    A = create_seeded_matrix(size, seed)
+    B = create_seeded_matrix(size, seed + 1)
     
     results = {
         'size': size,
+        'seed': seed,
+        'engine': 'python',
+        'operand_sample': [A[0][0], A[-1][-1], B[0][0], B[-1][-1]],
         'tests': []
     }
     
@@ -86,19 +98,21 @@ def benchmark_matrix_size(size, workers_list=[1, 2, 4, 8]):
     return results
 
 
-def run_full_benchmark(sizes=[128, 256, 512, 1024], workers_list=[1, 2, 4, 8]):
+def run_full_benchmark(sizes=[128, 256, 512, 1024], workers_list=[1, 2, 4, 8], seed=42,
+                       filename='results/metrics.json'):
     print("=" * 80)
     print("COMPLETE BENCHMARK - Distributed Matrix Multiplication")
     print("=" * 80)
     print(f"\nSizes to test: {sizes}")
     print(f"Workers to test: {workers_list}")
+    print(f"Seed: {seed}")
     print(f"Available CPU cores: {psutil.cpu_count()}")
     
     all_results = []
     
     for size in sizes:
         try:
-            results = benchmark_matrix_size(size, workers_list)
+            results = benchmark_matrix_size(size, workers_list, seed)
             all_results.append(results)
         except KeyboardInterrupt:
             print("\n\n⚠️  Interrupted by user")
@@ -109,14 +123,14 @@ def run_full_benchmark(sizes=[128, 256, 512, 1024], workers_list=[1, 2, 4, 8]):
             traceback.print_exc()
     
     if all_results:
-        save_results(all_results)
+        save_results(all_results, filename)
         print_summary(all_results)
     
     return all_results
 
 
 def save_results(results, filename='results/metrics.json'):
-    os.makedirs('results', exist_ok=True)
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
     
     with open(filename, 'w') as f:
         json.dump(results, f, indent=2)
@@ -0,0 +1,273 @@
+# benchmark_suite.py
+import argparse
+import json
+import os
+import shutil
+import subprocess
+
+import psutil
+
+from benchmark import run_full_benchmark
+from distributed_matrix_multiplication import create_seeded_matrix
+
+SCHEMA_VERSION = 1
+
+UNIFIED_RESULTS = 'results/unified_metrics.json'
+PYTHON_RESULTS = 'results/python_metrics.json'
+JAVA_RESULTS = 'results/java_metrics.json'
+JAVA_JAR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    '..', 'java', 'Distributed-Matrix-Multiplication-Java', 'target',
+    'distributed-matrix-multiplication-1.0-SNAPSHOT.jar'
+)
+
+ALGORITHMS = [
+    ('Basic', 'basic'),
+    ('Optimized', 'optimized'),
+    ('MapReduce', 'distributed'),
+    ('Hazelcast', 'distributed'),
+]
+
+# Wall-clock phases of one multiply() and the time workers spent multiplying
+# inside them; whatever is left is moving data between processes or members
+PHASES = {
+    'python': (('map_time', 'shuffle_time', 'reduce_time'),
+               ('map_compute_time', 'reduce_compute_time')),
+    'java': (('distribute_time', 'compute_time', 'collect_time'),
+             ('compute_time',)),
+}
+
+
+def classify_test(name):
+    for pattern, algorithm in ALGORITHMS:
+        if pattern in name:
+            return algorithm
+    return 'unknown'
+
+
+def normalize_phases(engine, test):
+    source = test.get('metrics', {}) if engine == 'python' else test.get('phases', {})
+    wall_phases, compute_phases = PHASES[engine]
+    phases = {k: source[k] for k in wall_phases + compute_phases if k in source}
+
+    # Older result files lack the compute split, so their overhead is not comparable
+    if len(phases) < len(set(wall_phases + compute_phases)):
+        return phases, None, None
+
+    computation = sum(phases[k] for k in compute_phases)
+    communication = sum(phases[k] for k in wall_phases) - computation
+    return phases, computation, communication
+
+
+def operand_sample(size, seed):
+    A = create_seeded_matrix(size, seed)
+    B = create_seeded_matrix(size, seed + 1)
+    return [A[0][0], A[-1][-1], B[0][0], B[-1][-1]]
+
+
+def normalize_results(raw, engine=None, seed=None):
+    records = []
+
+    for size_result in raw:
+        size_engine = size_result.get('engine', engine)
+        if size_engine not in PHASES:
+            raise ValueError(f"unknown engine for size {size_result.get('size')}: {size_engine}")
+
+        size = int(size_result['size'])
+
+        if seed is not None and size_result.get('seed') != seed:
+            print(f"⚠️  Skipping {size_engine} results for size {size}: "
+                  f"seed {size_result.get('seed')} does not match {seed}")
+            continue
+
+        # The last element depends on the whole generator stream, so a match
+        # means this engine multiplied the same operands as create_seeded_matrix
+        sample = size_result.get('operand_sample')
+        if seed is not None and sample is not None and sample != operand_sample(size, seed):
+            print(f"⚠️  Skipping {size_engine} results for size {size}: "
+                  f"operands differ from create_seeded_matrix({size}, {seed})")
+            continue
+
+        tests = size_result['tests']
+        baseline = next(
+            (t['total_time'] for t in tests if classify_test(t['name']) == 'basic'),
+            tests[0]['total_time']
+        )
+
+        for test in tests:
+            num_workers = int(test.get('num_workers', 1))
+            speedup = baseline / test['total_time']
+            phases, computation, communication = normalize_phases(size_engine, test)
+
+            overhead = None
+            if communication is not None and computation + communication > 0:
+                overhead = communication / (computation + communication) * 100
+
+            records.append({
+                'schema_version': SCHEMA_VERSION,
+                'engine': size_engine,
+                'algorithm': classify_test(test['name']),
+                'name': test['name'],
+                'size': size,
+                'num_workers': num_workers,
+                'seed': size_result.get('seed'),
+                'total_time': test['total_time'],
+                'memory_mb': test.get('memory_mb'),
+                'startup_time': test.get('startup_time'),
+                'speedup': speedup,
+                'efficiency': speedup / num_workers,
+                'phases': phases,
+                'computation_time': computation,
+                'communication_time': communication,
+                'overhead_percentage': overhead
+            })
+
+    return records
+
+
+def load_results(filename):
+    with open(filename, 'r') as f:
+        return json.load(f)
+
+
+def run_python_engine(sizes, workers_list, seed, filename=PYTHON_RESULTS):
+    run_full_benchmark(sizes=sizes, workers_list=workers_list, seed=seed, filename=filename)
+    return load_results(filename)
+
+
+def check_java_engine(jar=JAVA_JAR):
+    if shutil.which('java') is None:
+        raise FileNotFoundError("'java' not found on PATH")
+    if not os.path.exists(jar):
+        raise FileNotFoundError(f"{jar} not found, build it with 'mvn package' first")
+
+
+def run_java_engine(sizes, workers_list, seed, jar=JAVA_JAR, filename=JAVA_RESULTS):
+    check_java_engine(jar)
+
+    command = [
+        'java', '-jar', os.path.abspath(jar),
+        '--sizes', ','.join(str(s) for s in sizes),
+        '--workers', ','.join(str(w) for w in workers_list),
+        '--seed', str(seed),
+        '--output', os.path.abspath(filename)
+    ]
+    print(f"\nRunning: {' '.join(command)}")
+    subprocess.run(command, check=True)
+
+    return load_results(filename)
+
+
+def run_suite(sizes, workers_list, seed=42, engines=('python', 'java'),
+              java_jar=JAVA_JAR, python_results=None, java_results=None,
+              filename=UNIFIED_RESULTS):
+    # Fail before the Python engine spends minutes on a run that cannot finish
+    if 'java' in engines and not java_results:
+        check_java_engine(java_jar)
+
+    records = []
+
+    if 'python' in engines:
+        raw = load_results(python_results) if python_results else \
+            run_python_engine(sizes, workers_list, seed)
+        records.extend(normalize_results(raw, 'python', seed))
+
+    if 'java' in engines:
+        raw = load_results(java_results) if java_results else \
+            run_java_engine(sizes, workers_list, seed, java_jar)
+        records.extend(normalize_results(raw, 'java', seed))
+
+    check_coverage(records, engines, sizes, workers_list)
+
+    unified = {
+        'schema_version': SCHEMA_VERSION,
+        'seed': seed,
+        'sizes': sizes,
+        'workers': workers_list,
+        'records': records
+    }
+
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    with open(filename, 'w') as f:
+        json.dump(unified, f, indent=2)
+
+    print(f"\n✓ Unified results saved to:  {filename}")
+    print_comparison(records)
+
+    return unified
+
+
+def check_coverage(records, engines, sizes, workers_list):
+    runs = {engine: set() for engine in engines}
+    for record in records:
+        if record['algorithm'] == 'distributed':
+            runs[record['engine']].add((record['size'], record['num_workers']))
+
+    requested = {(size, workers) for size in sizes for workers in workers_list}
+
+    for engine, engine_runs in runs.items():
+        if not engine_runs:
+            print(f"⚠️  No {engine} results left to compare")
+        elif not engine_runs & requested:
+            print(f"⚠️  {engine} results cover none of the requested sizes/workers")
+
+    if len(runs) > 1 and not set.intersection(*runs.values()):
+        print("⚠️  The engines share no size/workers combination, nothing to compare head-to-head")
+
+
+def print_comparison(records):
+    print("\n" + "=" * 80)
+    print("PYTHON vs JAVA - Distributed engines")
+    print("=" * 80)
+
+    print(f"\n{'Size':<10} {'Workers':<10} {'Python (s)':<14} {'Java (s)':<14} {'Java speedup':<12}")
+    print("-" * 80)
+
+    times = {}
+    for record in records:
+        if record['algorithm'] == 'distributed':
+            key = (record['size'], record['num_workers'])
+            times.setdefault(key, {})[record['engine']] = record['total_time']
+
+    for (size, workers), by_engine in sorted(times.items()):
+        python_time = by_engine.get('python')
+        java_time = by_engine.get('java')
+
+        python_str = f"{python_time:.4f}" if python_time is not None else "-"
+        java_str = f"{java_time:.4f}" if java_time is not None else "-"
+        ratio_str = f"{python_time / java_time:.2f}x" if python_time and java_time else "-"
+
+        print(f"{size:<10} {workers:<10} {python_str:<14} {java_str:<14} {ratio_str:<12}")
+
+
+def parse_int_list(value):
+    return [int(v) for v in value.split(',')]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run the Python and Java engines over the same sizes, workers and seed"
+    )
+    parser.add_argument('--sizes', type=parse_int_list, default=[128, 256, 512, 1024])
+    parser.add_argument('--workers', type=parse_int_list, default=[1, 2, 4, 8])
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--engines', type=lambda v: v.split(','), default=['python', 'java'])
+    parser.add_argument('--java-jar', default=JAVA_JAR)
+    parser.add_argument('--python-results', help="reuse an existing Python metrics file")
+    parser.add_argument('--java-results', help="reuse an existing Java metrics file")
+    parser.add_argument('--output', default=UNIFIED_RESULTS)
+    args = parser.parse_args()
+
+    max_cores = psutil.cpu_count()
+    workers = [w for w in args.workers if w <= max_cores]
+
+    try:
+        run_suite(args.sizes, workers, args.seed, args.engines, args.java_jar,
+                  args.python_results, args.java_results, args.output)
+    except FileNotFoundError as e:
+        print(f"\nError: {e}")
+        print("Use --engines python, or pass --java-results with an existing Java metrics file")
+        raise SystemExit(1)
+
+    print("\n✓ SUITE COMPLETED")
+    print("\nYou can run 'python generate_report.py' to generate plots")
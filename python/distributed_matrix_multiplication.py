@@ -22,6 +22,7 @@ class MapReduceMatrixMultiplier:
     def map_worker(args):
         A_block, B, block_id, start_row = args
         results = []
+        start = time.time()
         
         for local_i, row_A in enumerate(A_block):
             global_i = start_row + local_i
@@ -29,7 +30,7 @@ class MapReduceMatrixMultiplier:
                 partial_sum = sum(row_A[k] * B[k][j] for k in range(len(row_A)))
                 results.append(((global_i, j), partial_sum))
         
-        return results
+        return results, time.time() - start
     
     def shuffle_phase(self, map_results):
         shuffled = defaultdict(list)
@@ -42,14 +43,15 @@ class MapReduceMatrixMultiplier:
     
     @staticmethod
     def reduce_worker(args):
-        key, values = args
-        return (key, sum(values))
+        start = time.time()
+        results = [(key, sum(values)) for key, values in args]
+        return results, time.time() - start
     
     def multiply(self, A, B, measure_overhead=True):
         n = len(A)
         m = len(B[0])
         
-        block_size = max(1, n // self.num_workers)
+        block_size = max(1, -(-n // self.num_workers))
         
         metrics = {}
         
@@ -65,7 +67,11 @@ class MapReduceMatrixMultiplier:
                 A_block = A[start_row:end_row]
                 map_tasks.append((A_block, B, block_id, start_row))
         
-        map_results = self.pool.map(self.map_worker, map_tasks)
+        map_output = self.pool.map(self.map_worker, map_tasks)
+        map_results = [results for results, _ in map_output]
+        # One task per worker, so the slowest one bounds the compute part;
+        # the rest of the phase is sending blocks to workers and results back
+        map_compute_time = max(elapsed for _, elapsed in map_output)
         
         if measure_overhead:
             metrics['map_time'] = time. time() - start_map
@@ -81,9 +87,16 @@ class MapReduceMatrixMultiplier:
         if measure_overhead:
             start_reduce = time.time()
         
-        reduce_tasks = list(shuffled.items())
+        reduce_items = list(shuffled.items())
+        chunk_size = max(1, -(-len(reduce_items) // self.num_workers))
+        reduce_tasks = [
+            reduce_items[i:i + chunk_size]
+            for i in range(0, len(reduce_items), chunk_size)
+        ]
         
-        reduced_results = self.pool.map(self.reduce_worker, reduce_tasks)
+        reduce_output = self.pool.map(self.reduce_worker, reduce_tasks)
+        reduced_results = [item for results, _ in reduce_output for item in results]
+        reduce_compute_time = max(elapsed for _, elapsed in reduce_output)
         
         if measure_overhead:
             metrics['reduce_time'] = time.time() - start_reduce
@@ -99,8 +112,14 @@ class MapReduceMatrixMultiplier:
                 metrics['shuffle_time'],
                 metrics['reduce_time']
             ])
-            metrics['computation_time'] = metrics['map_time'] + metrics['reduce_time']
-            metrics['communication_overhead'] = metrics['shuffle_time']
+            metrics['map_compute_time'] = map_compute_time
+            metrics['reduce_compute_time'] = reduce_compute_time
+            metrics['transfer_time'] = (
+                metrics['map_time'] - map_compute_time +
+                metrics['reduce_time'] - reduce_compute_time
+            )
+            metrics['computation_time'] = map_compute_time + reduce_compute_time
+            metrics['communication_overhead'] = metrics['shuffle_time'] + metrics['transfer_time']
             metrics['overhead_percentage'] = (
                 metrics['communication_overhead'] / metrics['total_time']
             ) * 100
@@ -142,7 +161,7 @@ class ParallelMatrixMultiplier:
         
         start_time = time.time()
         
-        block_size = max(1, n // self.num_workers)
+        block_size = max(1, -(-n // self.num_workers))
         
         tasks = []
         for block_id in range(self.num_workers):
@@ -221,6 +240,26 @@ def create_random_matrix(n, m=None, min_val=0.0, max_val=10.0):
     return [[random.uniform(min_val, max_val) for _ in range(m)] for _ in range(n)]
 
 
+# Same 64-bit LCG as MatrixUtils.createSeededMatrix in the Java engine, so both
+# engines multiply bit-identical operands for a given seed.
+LCG_MULTIPLIER = 6364136223846793005
+LCG_INCREMENT = 1442695040888963407
+LCG_MASK = (1 << 64) - 1
+
+
+def create_seeded_matrix(n, seed, min_val=0.0, max_val=10.0):
+    state = seed & LCG_MASK
+    scale = max_val - min_val
+    matrix = []
+    for _ in range(n):
+        row = []
+        for _ in range(n):
+            state = (state * LCG_MULTIPLIER + LCG_INCREMENT) & LCG_MASK
+            row.append(min_val + scale * ((state >> 11) * 2.0 ** -53))
+        matrix.append(row)
+    return matrix
+
+
 def measure_memory():
     process = psutil.Process(os. getpid())
     return process.memory_info().rss / (1024 * 1024)  # MB
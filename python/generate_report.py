@@ -3,17 +3,66 @@ import matplotlib.pyplot as plt
 import numpy as np
 import os
 
+ENGINE_STYLES = {
+    'python': {'linestyle': '-', 'marker': 'o', 'color': '#3498db', 'label': 'Python (MapReduce)'},
+    'java': {'linestyle': '--', 'marker': 's', 'color': '#e74c3c', 'label': 'Java (Hazelcast)'},
+}
+
+
 def load_results(filename='results/metrics.json'):
     with open(filename, 'r') as f:
-        return json. load(f)
+        results = json. load(f)
+    
+    # The Java engine writes sizes as doubles
+    for result in results:
+        result['size'] = int(result['size'])
+    return results
+
+
+def is_distributed(name):
+    return 'MapReduce' in name or 'Hazelcast' in name
+
+
+def test_phases(test):
+    phases = test.get('phases')
+    if phases:
+        return [
+            ('Distribute Phase (Communication)', phases.get('distribute_time', 0), '#e74c3c'),
+            ('Compute Phase', phases.get('compute_time', 0), '#3498db'),
+            ('Collect Phase (Communication)', phases.get('collect_time', 0), '#f39c12'),
+        ]
+    
+    metrics = test.get('metrics', {})
+    if 'map_time' in metrics:
+        return [
+            ('Map Phase', metrics['map_time'], '#3498db'),
+            ('Shuffle Phase (Communication)', metrics.get('shuffle_time', 0), '#e74c3c'),
+            ('Reduce Phase', metrics.get('reduce_time', 0), '#2ecc71'),
+        ]
+    
+    return None
+
+
+def test_overhead(test):
+    metrics = test.get('metrics', {})
+    if 'overhead_percentage' in metrics:
+        return metrics['overhead_percentage']
+    
+    phases = test.get('phases')
+    if phases:
+        total = sum(phases.values())
+        communication = phases.get('distribute_time', 0) + phases.get('collect_time', 0)
+        return communication / total * 100 if total > 0 else None
+    
+    return None
 
 
 def plot_scalability(results):
     sizes = [r['size'] for r in results]
     
     basic_times = []
-    numpy_times = []
-    ray_times = {1: [], 2: [], 4: [], 8: []}
+    optimized_times = []
+    distributed_times = {}
     
     for result in results: 
         tests = result['tests']
@@ -24,24 +73,23 @@ def plot_scalability(results):
             
             if 'Basic' in name or 'secuencial' in name:
                 basic_times.append(time_val)
-            elif 'NumPy' in name or 'optimizado' in name:
-                numpy_times.append(time_val)
-            elif 'Ray' in name: 
+            elif 'Optimized' in name or 'optimizado' in name:
+                optimized_times.append(time_val)
+            elif is_distributed(name):
                 workers = test. get('num_workers', 1)
-                if workers in ray_times:
-                    ray_times[workers].append(time_val)
+                distributed_times.setdefault(workers, []).append(time_val)
     
     fig, ax = plt.subplots(figsize=(10, 6))
     
     if len(basic_times) == len(sizes):
         ax.plot(sizes, basic_times, 'o-', label='Básico (secuencial)', linewidth=2, markersize=8)
     
-    if len(numpy_times) == len(sizes):
-        ax.plot(sizes, numpy_times, 's-', label='NumPy (optimizado)', linewidth=2, markersize=8)
+    if len(optimized_times) == len(sizes):
+        ax.plot(sizes, optimized_times, 's-', label='Optimizado (cache-friendly)', linewidth=2, markersize=8)
     
-    for workers, times in ray_times.items():
+    for workers, times in sorted(distributed_times.items()):
         if len(times) == len(sizes):
-            ax.plot(sizes, times, '^--', label=f'Ray ({workers} workers)', linewidth=2, markersize=8)
+            ax.plot(sizes, times, '^--', label=f'Distribuido ({workers} workers)', linewidth=2, markersize=8)
     
     ax.set_xlabel('Tamaño de Matriz (N×N)', fontsize=12)
     ax.set_ylabel('Tiempo de Ejecución (segundos)', fontsize=12)
@@ -68,7 +116,7 @@ def plot_speedup(results):
         baseline_time = result['tests'][0]['total_time']
         
         for test in result['tests']: 
-            if 'MapReduce' in test['name']: 
+            if is_distributed(test['name']): 
                 workers = test['num_workers']
                 speedup = baseline_time / test['total_time']
                 speedup_data[size][workers] = speedup
@@ -114,7 +162,7 @@ def plot_efficiency(results):
         efficiency_data[size] = {}
         
         for test in result['tests']:
-            if 'MapReduce' in test['name'] and 'efficiency' in test: 
+            if is_distributed(test['name']) and 'efficiency' in test: 
                 workers = test['num_workers']
                 efficiency_data[size][workers] = test['efficiency']
     
@@ -158,14 +206,18 @@ def plot_overhead(results):
         size = result['size']
         
         for test in result['tests']: 
-            if 'MapReduce' in test['name']:
+            if is_distributed(test['name']):
                 workers = test['num_workers']
-                metrics = test['metrics']
+                overhead = test_overhead(test)
                 
-                if 'overhead_percentage' in metrics:
+                if overhead is not None:
                     if workers not in overhead_data: 
                         overhead_data[workers] = {}
-                    overhead_data[workers][size] = metrics['overhead_percentage']
+                    overhead_data[workers][size] = overhead
+    
+    if not overhead_data:
+        print("⚠️  Sin tiempos por fase, se omite results/plots/overhead.png")
+        return
     
     fig, ax = plt.subplots(figsize=(10, 7))
     
@@ -198,29 +250,29 @@ def plot_phase_breakdown(results):
     size = last_result['size']
     
     workers_list = []
-    map_times = []
-    shuffle_times = []
-    reduce_times = []
+    phase_rows = []
     
     for test in last_result['tests']: 
-        if 'MapReduce' in test['name']:
-            metrics = test['metrics']
-            workers_list.append(test['num_workers'])
-            map_times.append(metrics.get('map_time', 0))
-            shuffle_times.append(metrics.get('shuffle_time', 0))
-            reduce_times.append(metrics.get('reduce_time', 0))
+        if is_distributed(test['name']):
+            phases = test_phases(test)
+            if phases is not None:
+                workers_list.append(test['num_workers'])
+                phase_rows.append(phases)
+    
+    if not phase_rows:
+        print("⚠️  Sin tiempos por fase, se omite results/plots/phase_breakdown.png")
+        return
     
     fig, ax = plt.subplots(figsize=(10, 7))
     
     x = np.arange(len(workers_list))
     width = 0.6
+    bottom = np.zeros(len(workers_list))
     
-    p1 = ax.bar(x, map_times, width, label='Map Phase', color='#3498db')
-    p2 = ax.bar(x, shuffle_times, width, bottom=map_times, 
-                label='Shuffle Phase (Communication)', color='#e74c3c')
-    p3 = ax.bar(x, reduce_times, width, 
-                bottom=np.array(map_times) + np.array(shuffle_times),
-                label='Reduce Phase', color='#2ecc71')
+    for idx, (label, _, color) in enumerate(phase_rows[0]):
+        times = np.array([row[idx][1] for row in phase_rows])
+        ax.bar(x, times, width, bottom=bottom, label=label, color=color)
+        bottom += times
     
     ax.set_xlabel('Number of Workers', fontsize=14, fontweight='bold')
     ax.set_ylabel('Time (seconds)', fontsize=14, fontweight='bold')
@@ -236,44 +288,197 @@ def plot_phase_breakdown(results):
     print("✓ Gráfica guardada:  results/plots/phase_breakdown.png")
 
 
-def generate_all_plots(results_file='results/metrics.json'):
+def load_unified_results(filename='results/unified_metrics.json'):
+    with open(filename, 'r') as f:
+        return json.load(f)['records']
+
+
+def distributed_by_engine(records, size):
+    grouped = {}
+    for record in records:
+        if record['algorithm'] == 'distributed' and record['size'] == size:
+            grouped.setdefault(record['engine'], {})[record['num_workers']] = record
+    return grouped
+
+
+def plot_engine_metric(records, metric, ylabel, title, filename, scale=1.0, ideal=None):
+    sizes = sorted({r['size'] for r in records if r['algorithm'] == 'distributed'})
+    
+    fig, axes = plt.subplots(1, len(sizes), figsize=(5 * len(sizes), 5), squeeze=False)
+    
+    for ax, size in zip(axes[0], sizes):
+        grouped = distributed_by_engine(records, size)
+        all_workers = set()
+        
+        for engine, by_workers in sorted(grouped.items()):
+            style = ENGINE_STYLES[engine]
+            workers_list = sorted(by_workers.keys())
+            values = [by_workers[w][metric] * scale for w in workers_list]
+            all_workers.update(workers_list)
+            
+            ax.plot(workers_list, values, linestyle=style['linestyle'], marker=style['marker'],
+                    color=style['color'], label=style['label'], linewidth=2.5, markersize=8)
+        
+        if ideal == 'linear' and all_workers:
+            max_workers = max(all_workers)
+            ax.plot([1, max_workers], [1, max_workers], 'k:', label='Ideal (linear)', alpha=0.5)
+        elif ideal is not None:
+            ax.axhline(y=ideal, color='k', linestyle=':', label=f'Ideal ({ideal:g})', alpha=0.5)
+        
+        ax.set_title(f'{size}×{size}', fontsize=13, fontweight='bold')
+        ax.set_xlabel('Number of Workers', fontsize=12)
+        ax.set_xticks(sorted(all_workers))
+        ax.grid(True, alpha=0.3, linestyle='--')
+    
+    axes[0][0].set_ylabel(ylabel, fontsize=12, fontweight='bold')
+    axes[0][-1].legend(fontsize=10)
+    fig.suptitle(title, fontsize=16, fontweight='bold')
+    
+    plt.tight_layout()
+    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    print(f"✓ Gráfica guardada:  {filename}")
+    plt.close()
+
+
+def plot_engine_speedup(records):
+    plot_engine_metric(records, 'speedup', 'Speedup (vs own sequential)',
+                       'Python vs Java: Speedup', 'results/plots/engine_speedup.png',
+                       ideal='linear')
+
+
+def plot_engine_efficiency(records):
+    plot_engine_metric(records, 'efficiency', 'Efficiency (%)',
+                       'Python vs Java: Parallel Efficiency', 'results/plots/engine_efficiency.png',
+                       scale=100, ideal=100)
+
+
+def plot_engine_memory(records):
+    plot_engine_metric(records, 'memory_mb', 'Memory (MB)',
+                       'Python vs Java: Memory Usage', 'results/plots/engine_memory.png')
+
+
+def plot_engine_phases(records):
+    phased_sizes = [r['size'] for r in records
+                    if r['algorithm'] == 'distributed' and r.get('communication_time') is not None]
+    if not phased_sizes:
+        print("⚠️  Sin tiempos por fase, se omite results/plots/engine_phases.png")
+        return
+    
+    size = max(phased_sizes)
+    grouped = distributed_by_engine(records, size)
+    
+    workers_list = sorted({w for by_workers in grouped.values() for w in by_workers})
+    engines = sorted(grouped.keys())
+    
+    fig, ax = plt.subplots(figsize=(10, 7))
+    
+    x = np.arange(len(workers_list))
+    width = 0.8 / max(1, len(engines))
+    
+    for idx, engine in enumerate(engines):
+        style = ENGINE_STYLES[engine]
+        offset = x + (idx - (len(engines) - 1) / 2) * width
+        
+        computation = []
+        communication = []
+        for w in workers_list:
+            record = grouped[engine].get(w, {})
+            computation.append(record.get('computation_time') or 0)
+            communication.append(record.get('communication_time') or 0)
+        
+        ax.bar(offset, computation, width, color=style['color'],
+               label=f"{style['label']} - computation")
+        ax.bar(offset, communication, width, bottom=computation, color=style['color'],
+               alpha=0.45, hatch='//', label=f"{style['label']} - communication")
+        
+        for xi, w in zip(offset, workers_list):
+            overhead = grouped[engine].get(w, {}).get('overhead_percentage')
+            if overhead is not None:
+                total = grouped[engine][w]['computation_time'] + grouped[engine][w]['communication_time']
+                ax.annotate(f'{overhead:.1f}%', (xi, total), ha='center', va='bottom', fontsize=9)
+    
+    ax.set_xlabel('Number of Workers', fontsize=14, fontweight='bold')
+    ax.set_ylabel('Time (seconds)', fontsize=14, fontweight='bold')
+    ax.set_title(f'Per-phase Overhead for {size}×{size} Matrix: Python vs Java',
+                 fontsize=16, fontweight='bold', pad=20)
+    ax.set_xticks(x)
+    ax.set_xticklabels(workers_list)
+    ax.legend(fontsize=10)
+    ax.grid(True, alpha=0.3, axis='y', linestyle='--')
+    
+    plt.tight_layout()
+    plt.savefig('results/plots/engine_phases.png', dpi=300, bbox_inches='tight')
+    print("✓ Gráfica guardada:  results/plots/engine_phases.png")
+    plt.close()
+
+
+def generate_engine_plots(unified_file='results/unified_metrics.json'):
+    print(f"\nCargando resultados unificados desde:  {unified_file}")
+    records = load_unified_results(unified_file)
+    print(f"✓ Cargados {len(records)} registros")
+    
+    os.makedirs('results/plots', exist_ok=True)
+    
+    print("\nGenerando gráficas comparativas...")
+    plot_engine_speedup(records)
+    plot_engine_efficiency(records)
+    plot_engine_memory(records)
+    plot_engine_phases(records)
+
+
+def generate_all_plots(results_file='results/metrics.json',
+                       unified_file='results/unified_metrics.json'):
     print("\n" + "=" * 80)
     print("GENERANDO GRÁFICAS")
     print("=" * 80)
     
-    print(f"\nCargando resultados desde:  {results_file}")
-    results = load_results(results_file)
-    print(f"✓ Cargados {len(results)} conjuntos de resultados")
+    has_legacy = os.path.exists(results_file)
+    has_unified = os.path.exists(unified_file)
+    
+    if not has_legacy and not has_unified:
+        raise FileNotFoundError(results_file)
     
     os.makedirs('results/plots', exist_ok=True)
     
-    print("\nGenerando gráficas...")
-    plot_scalability(results)
-    plot_speedup(results)
-    plot_efficiency(results)
-    plot_overhead(results)
-    plot_phase_breakdown(results)
+    if has_legacy:
+        print(f"\nCargando resultados desde:  {results_file}")
+        results = load_results(results_file)
+        print(f"✓ Cargados {len(results)} conjuntos de resultados")
+        
+        print("\nGenerando gráficas...")
+        plot_scalability(results)
+        plot_speedup(results)
+        plot_efficiency(results)
+        plot_overhead(results)
+        plot_phase_breakdown(results)
+    
+    if has_unified:
+        generate_engine_plots(unified_file)
     
     print("\n" + "=" * 80)
     print("✓ TODAS LAS GRÁFICAS GENERADAS")
     print("=" * 80)
     print("\nGráficas disponibles en: results/plots/")
-    print("  - scalability.png")
-    print("  - speedup.png")
-    print("  - efficiency.png")
-    print("  - overhead.png")
-    print("  - phase_breakdown.png")
+    if has_legacy:
+        print("  - scalability.png")
+        print("  - speedup.png")
+        print("  - efficiency.png")
+        print("  - overhead.png")
+        print("  - phase_breakdown.png")
+    if has_unified:
+        print("  - engine_speedup.png")
+        print("  - engine_efficiency.png")
+        print("  - engine_memory.png")
+        print("  - engine_phases.png")
 
 
 if __name__ == "__main__":
     try:
         generate_all_plots()
     except FileNotFoundError:
-        print("\nError: No se encontró el archivo results/metrics.json")
-        print("Primero debes ejecutar:  python benchmark.py")
+        print("\nError: No se encontró results/metrics.json ni results/unified_metrics.json")
+        print("Primero debes ejecutar:  python benchmark.py  o  python benchmark_suite.py")
     except Exception as e:
         print(f"\nError: {e}")
         import traceback
         traceback.print_exc()
-
-
@@ -0,0 +1,428 @@
+# matrix_cli.py
+import argparse
+import json
+import mmap
+import os
+import time
+from contextlib import nullcontext
+
+import numpy as np
+
+from distributed_matrix_multiplication import (
+    MapReduceMatrixMultiplier,
+    ParallelMatrixMultiplier,
+    BasicMatrixMultiplier,
+    OptimizedMatrixMultiplier,
+    measure_memory
+)
+
+ALGORITHMS = {
+    'basic': BasicMatrixMultiplier,
+    'optimized': OptimizedMatrixMultiplier,
+    'parallel': ParallelMatrixMultiplier,
+    'mapreduce': MapReduceMatrixMultiplier,
+}
+
+POOLED_ALGORITHMS = ('parallel', 'mapreduce')
+
+RAW_EXTENSIONS = ('.bin', '.raw', '.dat')
+
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def parse_shape(text):
+    if text is None:
+        return None
+    if isinstance(text, (list, tuple)):
+        rows, cols = text
+    else:
+        rows, cols = text.lower().split('x')
+    return int(rows), int(cols)
+
+
+def load_npy(path):
+    return np.load(path, mmap_mode='r')
+
+
+def load_raw(path, shape=None, dtype='float64'):
+    dtype = np.dtype(dtype)
+    size = os.path.getsize(path)
+    if size % dtype.itemsize != 0:
+        raise ValueError(f"{path}: {size} bytes is not a whole number of {dtype} values")
+    count = size // dtype.itemsize
+
+    if shape is None:
+        n = int(round(count ** 0.5))
+        if n * n != count:
+            raise ValueError(f"{path}: cannot infer a square shape from {count} values, pass a shape")
+        shape = (n, n)
+
+    if shape[0] * shape[1] != count:
+        raise ValueError(f"{path}: shape {shape[0]}x{shape[1]} does not match {count} values")
+
+    return np.memmap(path, dtype=dtype, mode='r', shape=shape)
+
+
+def load_matrix_market(path):
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header = mm.readline().decode('ascii').split()
+            if len(header) != 5 or header[0].lower() != '%%matrixmarket':
+                raise ValueError(f"{path}: missing MatrixMarket header")
+
+            _, obj, layout, field, symmetry = [h.lower() for h in header]
+            if obj != 'matrix' or field not in ('real', 'integer', 'pattern'):
+                raise ValueError(f"{path}: unsupported MatrixMarket type {' '.join(header[1:])}")
+
+            line = mm.readline()
+            while line.startswith(b'%') or not line.strip():
+                if line == b'':
+                    raise ValueError(f"{path}: missing size line")
+                line = mm.readline()
+            dims = [int(d) for d in line.split()]
+
+            expected = 2 if layout == 'array' else 3
+            if len(dims) != expected:
+                raise ValueError(f"{path}: expected {expected} values in the size line, got {len(dims)}")
+
+            body = mm[mm.tell():].decode('ascii')
+
+    values = np.fromstring(body, dtype=np.float64, sep=' ')
+    rows, cols = dims[0], dims[1]
+
+    if layout == 'array':
+        if symmetry == 'general':
+            return values.reshape((cols, rows)).T.copy()
+
+        # Only the lower triangle is stored, column by column
+        offset = 1 if symmetry == 'skew-symmetric' else 0
+        j, i = np.triu_indices(rows, offset)
+        matrix = np.zeros((rows, cols))
+        matrix[i, j] = values
+        sign = -1.0 if symmetry == 'skew-symmetric' else 1.0
+        off = i != j
+        matrix[j[off], i[off]] = sign * values[off]
+        return matrix
+
+    entries = 2 if field == 'pattern' else 3
+    values = values.reshape((dims[2], entries))
+    i = values[:, 0].astype(np.intp) - 1
+    j = values[:, 1].astype(np.intp) - 1
+    v = np.ones(len(i)) if field == 'pattern' else values[:, 2]
+
+    matrix = np.zeros((rows, cols))
+    np.add.at(matrix, (i, j), v)
+    if symmetry in ('symmetric', 'skew-symmetric'):
+        off = i != j
+        sign = -1.0 if symmetry == 'skew-symmetric' else 1.0
+        np.add.at(matrix, (j[off], i[off]), sign * v[off])
+
+    return matrix
+
+
+def load_matrix(path, shape=None, dtype='float64'):
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == '.npy':
+        matrix = load_npy(path)
+    elif ext == '.mtx':
+        matrix = load_matrix_market(path)
+    elif ext in RAW_EXTENSIONS:
+        matrix = load_raw(path, shape, dtype)
+    else:
+        raise ValueError(f"{path}: unsupported matrix format '{ext}'")
+
+    if matrix.ndim != 2:
+        raise ValueError(f"{path}: expected a 2-D matrix, got {matrix.ndim} dimensions")
+
+    return matrix
+
+
+class MatrixWriter:
+    """Escribe C por bloques de filas en .npy, binario raw o Matrix Market"""
+
+    def __init__(self, path, shape):
+        self.path = path
+        self.shape = shape
+        self.ext = os.path.splitext(path)[1].lower()
+        self.out = None
+
+        if self.ext not in ('.npy', '.mtx') + RAW_EXTENSIONS:
+            raise ValueError(f"{path}: unsupported output format '{self.ext}'")
+
+    def __enter__(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if self.ext == '.npy':
+            self.out = np.lib.format.open_memmap(
+                self.path, mode='w+', dtype=np.float64, shape=self.shape
+            )
+        else:
+            self.out = open(self.path, 'wb', buffering=WRITE_BUFFER_SIZE)
+            if self.ext == '.mtx':
+                rows, cols = self.shape
+                self.out.write(b'%%MatrixMarket matrix coordinate real general\n')
+                self.out.write(f"{rows} {cols} {rows * cols}\n".encode('ascii'))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.ext == '.npy':
+            self.out.flush()
+            del self.out
+        else:
+            self.out.close()
+
+    def write_tile(self, start_row, tile):
+        tile = np.asarray(tile, dtype=np.float64)
+
+        if self.ext == '.npy':
+            self.out[start_row:start_row + len(tile)] = tile
+        elif self.ext == '.mtx':
+            rows, cols = tile.shape
+            i, j = np.indices((rows, cols))
+            entries = np.column_stack((
+                (i + start_row + 1).ravel(), (j + 1).ravel(), tile.ravel()
+            ))
+            np.savetxt(self.out, entries, fmt=('%d', '%d', '%.17g'))
+        else:
+            tile.tofile(self.out)
+
+
+def open_multiplier(algorithm, num_workers):
+    multiplier_class = ALGORITHMS[algorithm]
+
+    if algorithm in POOLED_ALGORITHMS:
+        return multiplier_class(num_workers=num_workers)
+
+    return nullcontext(multiplier_class())
+
+
+def check_output_path(job):
+    output = os.path.realpath(job['output'])
+
+    for key in ('a', 'b'):
+        source = job[key]
+        same = os.path.realpath(source) == output
+        if not same and os.path.exists(output) and os.path.exists(source):
+            same = os.path.samefile(source, output)
+        if same:
+            raise ValueError(f"output {job['output']} would overwrite input {source}")
+
+
+def run_job(multiplier, job, tile_rows=128):
+    print(f"\n  Job: {job['a']} × {job['b']} -> {job['output']}")
+
+    check_output_path(job)
+
+    start_load = time.time()
+    A = load_matrix(job['a'], parse_shape(job.get('shape_a')), job.get('dtype', 'float64'))
+    B = load_matrix(job['b'], parse_shape(job.get('shape_b')), job.get('dtype', 'float64'))
+
+    if A.shape[1] != B.shape[0]:
+        raise ValueError(
+            f"incompatible shapes {A.shape[0]}x{A.shape[1]} and {B.shape[0]}x{B.shape[1]}"
+        )
+
+    B_rows = np.asarray(B, dtype=np.float64).tolist()
+    load_time = time.time() - start_load
+
+    n = A.shape[0]
+    m = B.shape[1]
+
+    compute_time = 0.0
+    write_time = 0.0
+    phase_metrics = {}
+
+    mem_before = measure_memory()
+
+    with MatrixWriter(job['output'], (n, m)) as writer:
+        for start_row in range(0, n, tile_rows):
+            end_row = min(start_row + tile_rows, n)
+
+            # Memory-mapped inputs are only read from disk here
+            start_tile_load = time.time()
+            A_tile = np.asarray(A[start_row:end_row], dtype=np.float64).tolist()
+            load_time += time.time() - start_tile_load
+
+            start_compute = time.time()
+            C_tile, metrics = multiplier.multiply(A_tile, B_rows)
+            compute_time += time.time() - start_compute
+
+            for key, value in metrics.items():
+                if key.endswith('_time') or key == 'communication_overhead':
+                    phase_metrics[key] = phase_metrics.get(key, 0.0) + value
+
+            start_write = time.time()
+            writer.write_tile(start_row, C_tile)
+            write_time += time.time() - start_write
+
+    mem_used = measure_memory() - mem_before
+
+    result = {
+        'a': job['a'],
+        'b': job['b'],
+        'output': job['output'],
+        'shape': [n, m],
+        'load_time': load_time,
+        'compute_time': compute_time,
+        'write_time': write_time,
+        'total_time': load_time + compute_time + write_time,
+        'memory_mb': mem_used,
+        'metrics': phase_metrics
+    }
+
+    print(f"    ✓ Load: {load_time:.4f}s | Compute: {compute_time:.4f}s | "
+          f"Write: {write_time:.4f}s | Memory: {mem_used:.2f}MB")
+
+    return result
+
+
+def load_manifest(path):
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+
+    jobs = manifest['jobs'] if isinstance(manifest, dict) else manifest
+    base_dir = os.path.dirname(os.path.abspath(path))
+
+    for job in jobs:
+        for key in ('a', 'b', 'output'):
+            if key not in job:
+                raise ValueError(f"{path}: job is missing '{key}'")
+            if not os.path.isabs(job[key]):
+                job[key] = os.path.join(base_dir, job[key])
+
+    return jobs
+
+
+def run_batch(jobs, algorithm='mapreduce', num_workers=4, tile_rows=128):
+    print("=" * 80)
+    print(f"BATCH - {len(jobs)} jobs | {algorithm} | {num_workers} workers")
+    print("=" * 80)
+
+    results = []
+
+    start_pool = time.time()
+    with open_multiplier(algorithm, num_workers) as multiplier:
+        pool_startup_time = time.time() - start_pool
+
+        for job in jobs:
+            try:
+                results.append(run_job(multiplier, job, tile_rows))
+            except KeyboardInterrupt:
+                print("\n\n⚠️  Interrupted by user")
+                break
+            except Exception as e:
+                print(f"\n⚠️  Error with job {job['output']}: {e}")
+                results.append({'a': job['a'], 'b': job['b'],
+                                'output': job['output'], 'error': str(e)})
+
+    print_batch_summary(results, pool_startup_time)
+
+    return {
+        'algorithm': algorithm,
+        'num_workers': num_workers,
+        'tile_rows': tile_rows,
+        'pool_startup_time': pool_startup_time,
+        'jobs': results
+    }
+
+
+def print_batch_summary(results, pool_startup_time):
+    print("\n" + "=" * 80)
+    print("BATCH SUMMARY")
+    print("=" * 80)
+    print(f"\nPool startup: {pool_startup_time:.4f}s")
+
+    print(f"\n{'Output':<30} {'Load (s)':<12} {'Compute (s)':<12} {'Write (s)':<12}")
+    print("-" * 80)
+
+    totals = {'load_time': 0.0, 'compute_time': 0.0, 'write_time': 0.0}
+
+    for result in results:
+        name = os.path.basename(result['output'])
+        if 'error' in result:
+            print(f"{name:<30} failed: {result['error']}")
+            continue
+
+        for key in totals:
+            totals[key] += result[key]
+        print(f"{name:<30} {result['load_time']:<12.4f} "
+              f"{result['compute_time']:<12.4f} {result['write_time']:<12.4f}")
+
+    print("-" * 80)
+    print(f"{'Total':<30} {totals['load_time']:<12.4f} "
+          f"{totals['compute_time']:<12.4f} {totals['write_time']:<12.4f}")
+
+
+def save_report(report, filename):
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(filename, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n✓ Report saved to:  {filename}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Multiply matrices stored in .npy, raw binary or Matrix Market files"
+    )
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--algorithm', choices=sorted(ALGORITHMS), default='mapreduce')
+    common.add_argument('--workers', type=int, default=4,
+                        help="pool size for the parallel and mapreduce algorithms")
+    common.add_argument('--tile-rows', type=int, default=128,
+                        help="rows of C computed and written per tile")
+    common.add_argument('--report', help="write timings as JSON to this file")
+
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    multiply = subparsers.add_parser('multiply', parents=[common],
+                                     help="compute C = A × B for a single pair")
+    multiply.add_argument('a', help="input matrix A")
+    multiply.add_argument('b', help="input matrix B")
+    multiply.add_argument('-o', '--output', required=True, help="output matrix C")
+    multiply.add_argument('--shape-a', help="ROWSxCOLS of a raw binary A")
+    multiply.add_argument('--shape-b', help="ROWSxCOLS of a raw binary B")
+    multiply.add_argument('--dtype', default='float64', help="element type of raw binary inputs")
+
+    batch = subparsers.add_parser('batch', parents=[common],
+                                  help="run every job of a JSON manifest on one pool")
+    batch.add_argument('manifest', help="JSON list of {a, b, output[, shape_a, shape_b, dtype]}")
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.workers < 1 or args.tile_rows < 1:
+        raise SystemExit("--workers and --tile-rows must be positive")
+
+    if args.command == 'multiply':
+        jobs = [{
+            'a': args.a,
+            'b': args.b,
+            'output': args.output,
+            'shape_a': args.shape_a,
+            'shape_b': args.shape_b,
+            'dtype': args.dtype
+        }]
+    else:
+        jobs = load_manifest(args.manifest)
+
+    report = run_batch(jobs, args.algorithm, args.workers, args.tile_rows)
+
+    if args.report:
+        save_report(report, args.report)
+
+    return 1 if any('error' in job for job in report['jobs']) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())